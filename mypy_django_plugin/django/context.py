@@ -222,6 +222,11 @@ class DjangoContext:
     def all_registered_model_class_fullnames(self) -> Set[str]:
         return {helpers.get_class_fullname(cls) for cls in self.all_registered_model_classes}
 
+    @cached_property
+    def auth_user_model_fullname(self) -> str:
+        auth_user_model_cls = self.apps_registry.get_model(self.settings.AUTH_USER_MODEL)
+        return helpers.get_class_fullname(auth_user_model_cls)
+
     def get_attname(self, field: Field) -> str:
         attname = field.attname
         return attname
@@ -10,14 +10,14 @@ from mypy import checker
 from mypy.checker import TypeChecker
 from mypy.mro import calculate_mro
 from mypy.nodes import (
-    GDEF, MDEF, Argument, Block, ClassDef, Expression, FuncDef, MemberExpr, MypyFile, NameExpr, PlaceholderNode,
-    StrExpr, SymbolNode, SymbolTable, SymbolTableNode, TypeInfo, Var,
+    GDEF, MDEF, Argument, Block, ClassDef, Expression, FuncDef, MemberExpr, MypyFile, NameExpr, StrExpr,
+    SymbolNode, SymbolTable, SymbolTableNode, TypeInfo, Var,
 )
 from mypy.plugin import (
     AttributeContext, CheckerPluginInterface, ClassDefContext, DynamicClassDefContext, FunctionContext, MethodContext,
 )
 from mypy.plugins.common import add_method
-from mypy.semanal import SemanticAnalyzer
+from mypy.semanal import SemanticAnalyzer, has_placeholder
 from mypy.types import AnyType, CallableType, Instance, NoneTyp, TupleType
 from mypy.types import Type as MypyType
 from mypy.types import TypedDictType, TypeOfAny, UnionType
@@ -323,12 +323,12 @@ def build_unannotated_method_args(method_node: FuncDef) -> Tuple[List[Argument],
 
 
 def copy_method_to_another_class(ctx: ClassDefContext, self_type: Instance,
-                                 new_method_name: str, method_node: FuncDef) -> None:
+                                 new_method_name: str, method_node: FuncDef) -> bool:
     semanal_api = get_semanal_api(ctx)
     if method_node.type is None:
         if not semanal_api.final_iteration:
             semanal_api.defer()
-            return
+            return False
 
         arguments, return_type = build_unannotated_method_args(method_node)
         add_method(ctx,
@@ -336,13 +336,13 @@ def copy_method_to_another_class(ctx: ClassDefContext, self_type: Instance,
                    args=arguments,
                    return_type=return_type,
                    self_type=self_type)
-        return
+        return True
 
     method_type = method_node.type
     if not isinstance(method_type, CallableType):
         if not semanal_api.final_iteration:
             semanal_api.defer()
-        return
+        return False
 
     arguments = []
     bound_return_type = semanal_api.anal_type(method_type.ret_type,
@@ -350,8 +350,8 @@ def copy_method_to_another_class(ctx: ClassDefContext, self_type: Instance,
 
     assert bound_return_type is not None
 
-    if isinstance(bound_return_type, PlaceholderNode):
-        return
+    if has_placeholder(bound_return_type):
+        return False
 
     for arg_name, arg_type, original_argument in zip(method_type.arg_names[1:],
                                                      method_type.arg_types[1:],
@@ -359,12 +359,12 @@ def copy_method_to_another_class(ctx: ClassDefContext, self_type: Instance,
         bound_arg_type = semanal_api.anal_type(arg_type, allow_placeholder=True)
         if bound_arg_type is None and not semanal_api.final_iteration:
             semanal_api.defer()
-            return
+            return False
 
         assert bound_arg_type is not None
 
-        if isinstance(bound_arg_type, PlaceholderNode):
-            return
+        if has_placeholder(bound_arg_type):
+            return False
 
         var = Var(name=original_argument.variable.name,
                   type=arg_type)
@@ -382,3 +382,4 @@ def copy_method_to_another_class(ctx: ClassDefContext, self_type: Instance,
                args=arguments,
                return_type=bound_return_type,
                self_type=self_type)
+    return True
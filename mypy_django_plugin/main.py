@@ -17,7 +17,7 @@ from mypy_django_plugin.transformers import (
     fields, forms, init_create, meta, querysets, request, settings,
 )
 from mypy_django_plugin.transformers.managers import (
-    create_new_manager_class_from_from_queryset_method,
+    GeneratedManagerStamps, QuerysetMethodsCache, create_new_manager_class_from_from_queryset_method,
 )
 from mypy_django_plugin.transformers.models import process_model_class
 
@@ -92,35 +92,54 @@ class NewSemanalDjangoPlugin(Plugin):
         super().__init__(options)
         django_settings_module = extract_django_settings_module(options.config_file)
         self.django_context = DjangoContext(django_settings_module)
+        self._queryset_methods_cache: QuerysetMethodsCache = {}
+        self._generated_manager_stamps: GeneratedManagerStamps = {}
+        self._base_class_infos: Dict[str, TypeInfo] = {}
+
+    def set_modules(self, modules: Dict[str, MypyFile]) -> None:
+        super().set_modules(modules)
+        # called once the module graph of a build is loaded, before any of it is analyzed;
+        # dmypy keeps the plugin between builds, and querysets may have been edited since
+        self._queryset_methods_cache.clear()
+        self._generated_manager_stamps.clear()
+
+    def _get_base_class_info_or_none(self, fullname: str) -> Optional[TypeInfo]:
+        # looked up on every hook call, and never replaced once loaded
+        info = self._base_class_infos.get(fullname)
+        if info is None:
+            info = self._get_typeinfo_or_none(fullname)
+            if info is not None:
+                self._base_class_infos[fullname] = info
+        return info
 
     def _get_current_queryset_bases(self) -> Dict[str, int]:
-        model_sym = self.lookup_fully_qualified(fullnames.QUERYSET_CLASS_FULLNAME)
-        if model_sym is not None and isinstance(model_sym.node, TypeInfo):
-            return (helpers.get_django_metadata(model_sym.node)
+        model_info = self._get_base_class_info_or_none(fullnames.QUERYSET_CLASS_FULLNAME)
+        if model_info is not None:
+            return (helpers.get_django_metadata(model_info)
                     .setdefault('queryset_bases', {fullnames.QUERYSET_CLASS_FULLNAME: 1}))
         else:
             return {}
 
     def _get_current_manager_bases(self) -> Dict[str, int]:
-        model_sym = self.lookup_fully_qualified(fullnames.MANAGER_CLASS_FULLNAME)
-        if model_sym is not None and isinstance(model_sym.node, TypeInfo):
-            return (helpers.get_django_metadata(model_sym.node)
+        model_info = self._get_base_class_info_or_none(fullnames.MANAGER_CLASS_FULLNAME)
+        if model_info is not None:
+            return (helpers.get_django_metadata(model_info)
                     .setdefault('manager_bases', {fullnames.MANAGER_CLASS_FULLNAME: 1}))
         else:
             return {}
 
     def _get_current_model_bases(self) -> Dict[str, int]:
-        model_sym = self.lookup_fully_qualified(fullnames.MODEL_CLASS_FULLNAME)
-        if model_sym is not None and isinstance(model_sym.node, TypeInfo):
-            return helpers.get_django_metadata(model_sym.node).setdefault('model_bases',
-                                                                          {fullnames.MODEL_CLASS_FULLNAME: 1})
+        model_info = self._get_base_class_info_or_none(fullnames.MODEL_CLASS_FULLNAME)
+        if model_info is not None:
+            return helpers.get_django_metadata(model_info).setdefault('model_bases',
+                                                                      {fullnames.MODEL_CLASS_FULLNAME: 1})
         else:
             return {}
 
     def _get_current_form_bases(self) -> Dict[str, int]:
-        model_sym = self.lookup_fully_qualified(fullnames.BASEFORM_CLASS_FULLNAME)
-        if model_sym is not None and isinstance(model_sym.node, TypeInfo):
-            return (helpers.get_django_metadata(model_sym.node)
+        model_info = self._get_base_class_info_or_none(fullnames.BASEFORM_CLASS_FULLNAME)
+        if model_info is not None:
+            return (helpers.get_django_metadata(model_info)
                     .setdefault('baseform_bases', {fullnames.BASEFORM_CLASS_FULLNAME: 1,
                                                    fullnames.FORM_CLASS_FULLNAME: 1,
                                                    fullnames.MODELFORM_CLASS_FULLNAME: 1}))
@@ -265,7 +284,9 @@ class NewSemanalDjangoPlugin(Plugin):
             class_name, _, _ = fullname.rpartition('.')
             info = self._get_typeinfo_or_none(class_name)
             if info and info.has_base(fullnames.BASE_MANAGER_CLASS_FULLNAME):
-                return create_new_manager_class_from_from_queryset_method
+                return partial(create_new_manager_class_from_from_queryset_method,
+                               queryset_methods_cache=self._queryset_methods_cache,
+                               generated_manager_stamps=self._generated_manager_stamps)
         return None
 
 
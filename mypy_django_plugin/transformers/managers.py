@@ -1,3 +1,5 @@
+from typing import Dict, List, Optional, Tuple
+
 from mypy.nodes import (
     GDEF, FuncDef, MemberExpr, NameExpr, RefExpr, StrExpr, SymbolTableNode, TypeInfo,
 )
@@ -6,8 +8,54 @@ from mypy.types import AnyType, Instance, TypeOfAny
 
 from mypy_django_plugin.lib import fullnames, helpers
 
+# AnyType has mutable line/column/source_any, sharing it as type argument of all generated managers
+# is safe only because nothing here sets them on the base Instance args
+_UNANNOTATED_ANY = AnyType(TypeOfAny.unannotated)
+
+# queryset info -> (stamp of custom MRO part, methods found there)
+QuerysetMethodsCache = Dict[TypeInfo, Tuple[List[int], List[Tuple[str, FuncDef]]]]
+
+# generated manager info -> (base manager info, queryset info, stamp of queryset's custom MRO part),
+# recorded once all queryset methods are copied into the manager
+GeneratedManagerStamps = Dict[TypeInfo, Tuple[TypeInfo, TypeInfo, List[int]]]
+
+
+def get_custom_queryset_mro(derived_queryset_info: TypeInfo) -> List[TypeInfo]:
+    # we need to copy all methods in MRO before django.db.models.query.QuerySet
+    mro = derived_queryset_info.mro
+    stop = next((i for i, class_mro_info in enumerate(mro)
+                 if class_mro_info.fullname == fullnames.QUERYSET_CLASS_FULLNAME), len(mro))
+    return mro[:stop]
+
+
+def get_custom_queryset_mro_stamp(custom_mro: List[TypeInfo]) -> List[int]:
+    # changes if any class methods are copied from is replaced, or gets new names
+    stamp = []
+    for class_mro_info in custom_mro:
+        stamp += [id(class_mro_info), len(class_mro_info.names)]
+    return stamp
 
-def create_new_manager_class_from_from_queryset_method(ctx: DynamicClassDefContext) -> None:
+
+def get_all_custom_queryset_methods(derived_queryset_info: TypeInfo,
+                                    custom_mro: List[TypeInfo],
+                                    stamp: List[int],
+                                    queryset_methods_cache: QuerysetMethodsCache) -> List[Tuple[str, FuncDef]]:
+    # from_queryset() is re-run on every deferral, reuse methods collected before if no class has changed since
+    cached = queryset_methods_cache.get(derived_queryset_info)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    methods = [(name, sym.node)
+               for class_mro_info in custom_mro
+               for name, sym in class_mro_info.names.items()
+               if isinstance(sym.node, FuncDef)]
+    queryset_methods_cache[derived_queryset_info] = (stamp, methods)
+    return methods
+
+
+def create_new_manager_class_from_from_queryset_method(ctx: DynamicClassDefContext,
+                                                       queryset_methods_cache: QuerysetMethodsCache,
+                                                       generated_manager_stamps: GeneratedManagerStamps) -> None:
     semanal_api = helpers.get_semanal_api(ctx)
 
     callee = ctx.call.callee
@@ -21,24 +69,38 @@ def create_new_manager_class_from_from_queryset_method(ctx: DynamicClassDefConte
         return
 
     assert isinstance(base_manager_info, TypeInfo)
+    call_args = ctx.call.args
+    passed_queryset = call_args[0]
+    assert isinstance(passed_queryset, NameExpr)
+
+    derived_queryset_fullname = passed_queryset.fullname
+    assert derived_queryset_fullname is not None
+
+    sym = semanal_api.lookup_fully_qualified_or_none(derived_queryset_fullname)
+    assert sym is not None
+
+    current_module = semanal_api.cur_mod_node
+    manager_stamp: Optional[Tuple[TypeInfo, TypeInfo, List[int]]] = None
+    if isinstance(sym.node, TypeInfo):
+        custom_mro = get_custom_queryset_mro(sym.node)
+        manager_stamp = (base_manager_info, sym.node, get_custom_queryset_mro_stamp(custom_mro))
+        existing_sym = current_module.names.get(ctx.name)
+        if (existing_sym is not None
+                and existing_sym.plugin_generated
+                and isinstance(existing_sym.node, TypeInfo)
+                and generated_manager_stamps.get(existing_sym.node) == manager_stamp):
+            # all methods were copied on previous iteration, and neither manager nor queryset has changed since
+            return
+
     new_manager_info = semanal_api.basic_new_typeinfo(ctx.name,
                                                       basetype_or_fallback=Instance(base_manager_info,
-                                                                                    [AnyType(TypeOfAny.unannotated)]))
+                                                                                    [_UNANNOTATED_ANY]))
     new_manager_info.line = ctx.call.line
     new_manager_info.defn.line = ctx.call.line
     new_manager_info.metaclass_type = new_manager_info.calculate_metaclass_type()
 
-    current_module = semanal_api.cur_mod_node
     current_module.names[ctx.name] = SymbolTableNode(GDEF, new_manager_info,
                                                      plugin_generated=True)
-    passed_queryset = ctx.call.args[0]
-    assert isinstance(passed_queryset, NameExpr)
-
-    derived_queryset_fullname = passed_queryset.fullname
-    assert derived_queryset_fullname is not None
-
-    sym = semanal_api.lookup_fully_qualified_or_none(derived_queryset_fullname)
-    assert sym is not None
     if sym.node is None:
         if not semanal_api.final_iteration:
             semanal_api.defer()
@@ -50,28 +112,31 @@ def create_new_manager_class_from_from_queryset_method(ctx: DynamicClassDefConte
     derived_queryset_info = sym.node
     assert isinstance(derived_queryset_info, TypeInfo)
 
-    if len(ctx.call.args) > 1:
-        expr = ctx.call.args[1]
+    if len(call_args) > 1:
+        expr = call_args[1]
         assert isinstance(expr, StrExpr)
         custom_manager_generated_name = expr.value
     else:
         custom_manager_generated_name = base_manager_info.name + 'From' + derived_queryset_info.name
 
-    custom_manager_generated_fullname = '.'.join(['django.db.models.manager', custom_manager_generated_name])
-    if 'from_queryset_managers' not in base_manager_info.metadata:
-        base_manager_info.metadata['from_queryset_managers'] = {}
-    base_manager_info.metadata['from_queryset_managers'][custom_manager_generated_fullname] = new_manager_info.fullname
+    custom_manager_generated_fullname = 'django.db.models.manager.' + custom_manager_generated_name
+    generated_managers = base_manager_info.metadata.get('from_queryset_managers')
+    if generated_managers is None:
+        generated_managers = base_manager_info.metadata['from_queryset_managers'] = {}
+    generated_managers[custom_manager_generated_fullname] = new_manager_info.fullname
 
     class_def_context = ClassDefContext(cls=new_manager_info.defn,
                                         reason=ctx.call, api=semanal_api)
     self_type = Instance(new_manager_info, [])
-    # we need to copy all methods in MRO before django.db.models.query.QuerySet
-    for class_mro_info in derived_queryset_info.mro:
-        if class_mro_info.fullname == fullnames.QUERYSET_CLASS_FULLNAME:
-            break
-        for name, sym in class_mro_info.names.items():
-            if isinstance(sym.node, FuncDef):
-                helpers.copy_method_to_another_class(class_def_context,
-                                                     self_type,
-                                                     new_method_name=name,
-                                                     method_node=sym.node)
+    assert manager_stamp is not None
+    copied_all_methods = True
+    for name, method_node in get_all_custom_queryset_methods(derived_queryset_info, custom_mro, manager_stamp[2],
+                                                             queryset_methods_cache):
+        if not helpers.copy_method_to_another_class(class_def_context,
+                                                    self_type,
+                                                    new_method_name=name,
+                                                    method_node=method_node):
+            copied_all_methods = False
+
+    if copied_all_methods:
+        generated_manager_stamps[new_manager_info] = manager_stamp
@@ -154,10 +154,9 @@ class AddManagers(ModelClassInitializer):
 
     def get_generated_manager_mappings(self, base_manager_fullname: str) -> Dict[str, str]:
         base_manager_info = self.lookup_typeinfo(base_manager_fullname)
-        if (base_manager_info is None
-                or 'from_queryset_managers' not in base_manager_info.metadata):
+        if base_manager_info is None:
             return {}
-        return base_manager_info.metadata['from_queryset_managers']
+        return base_manager_info.metadata.get('from_queryset_managers') or {}
 
     def create_new_model_parametrized_manager(self, name: str, base_manager_info: TypeInfo) -> Instance:
         bases = []
@@ -215,7 +214,7 @@ class AddManagers(ModelClassInitializer):
                     manager_info = self.lookup_typeinfo(real_manager_fullname)  # type: ignore
                     if manager_info is None:
                         continue
-                    manager_class_name = real_manager_fullname.rsplit('.', maxsplit=1)[1]
+                    manager_class_name = manager_info.name
 
             if manager_name not in self.model_classdef.info.names:
                 manager_type = Instance(manager_info, [Instance(self.model_classdef.info, [])])
@@ -12,23 +12,32 @@ def set_auth_user_model_as_type_for_request_user(ctx: AttributeContext, django_c
     from django.contrib.auth.base_user import AbstractBaseUser
     from django.contrib.auth.models import AnonymousUser
 
-    abstract_base_user_info = helpers.lookup_class_typeinfo(helpers.get_typechecker_api(ctx), AbstractBaseUser)
-    anonymous_user_info = helpers.lookup_class_typeinfo(helpers.get_typechecker_api(ctx), AnonymousUser)
+    default_attr_type = ctx.default_attr_type
+    if not isinstance(default_attr_type, UnionType) or len(default_attr_type.items) != 2:
+        # Can't be the Union[AbstractBaseUser, AnonymousUser] from django-stubs, user-type has been overridden.
+        return default_attr_type
+
+    first_item, second_item = default_attr_type.items
+    if not isinstance(first_item, Instance) or not isinstance(second_item, Instance):
+        return default_attr_type
+
+    api = helpers.get_typechecker_api(ctx)
+    abstract_base_user_info = helpers.lookup_class_typeinfo(api, AbstractBaseUser)
+    anonymous_user_info = helpers.lookup_class_typeinfo(api, AnonymousUser)
 
     # This shouldn't be able to happen, as we managed to import the models above.
     assert abstract_base_user_info is not None
     assert anonymous_user_info is not None
 
-    if ctx.default_attr_type != UnionType([Instance(abstract_base_user_info, []), Instance(anonymous_user_info, [])]):
+    if not ((first_item.type is abstract_base_user_info and second_item.type is anonymous_user_info)
+            or (first_item.type is anonymous_user_info and second_item.type is abstract_base_user_info)):
         # Type has been changed from the default in django-stubs.
         # I.e. HttpRequest has been subclassed and user-type overridden, so let's leave it as is.
-        return ctx.default_attr_type
+        return default_attr_type
 
-    auth_user_model = django_context.settings.AUTH_USER_MODEL
-    user_cls = django_context.apps_registry.get_model(auth_user_model)
-    user_info = helpers.lookup_class_typeinfo(helpers.get_typechecker_api(ctx), user_cls)
+    user_info = helpers.lookup_fully_qualified_typeinfo(api, django_context.auth_user_model_fullname)
 
     if user_info is None:
-        return ctx.default_attr_type
+        return default_attr_type
 
     return UnionType([Instance(user_info, []), Instance(anonymous_user_info, [])])
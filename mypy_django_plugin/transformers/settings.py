@@ -9,12 +9,8 @@ from mypy_django_plugin.lib import helpers
 
 
 def get_user_model_hook(ctx: FunctionContext, django_context: DjangoContext) -> MypyType:
-    auth_user_model = django_context.settings.AUTH_USER_MODEL
-    model_cls = django_context.apps_registry.get_model(auth_user_model)
-    model_cls_fullname = helpers.get_class_fullname(model_cls)
-
     model_info = helpers.lookup_fully_qualified_typeinfo(helpers.get_typechecker_api(ctx),
-                                                         model_cls_fullname)
+                                                         django_context.auth_user_model_fullname)
     if model_info is None:
         return AnyType(TypeOfAny.unannotated)
 